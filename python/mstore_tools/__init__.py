@@ -0,0 +1,5 @@
+"""mStore developer tools.
+
+Run `python -m mstore_tools <command>` from the `python/` folder. Keep this
+file free of imports: every subcommand is loaded lazily by `cli.py`.
+"""
@@ -0,0 +1,100 @@
+import sys
+import importlib
+
+# command -> (module, help). A module is imported only when its command runs,
+# so `python -m mstore_tools --help` never pays for zipfile, InquirerPy & co.
+COMMANDS = {
+    "zip": ("mstore_tools.zip_creator", "Create a release zip of the project (--manual to prompt for version/note)"),
+    "changelog": ("mstore_tools.markdown_creator", "Render versions.json into the full CHANGELOG markdown"),
+    "config": ("mstore_tools.config_editor", "Interactively edit source/settings/config.json"),
+    "timestamp": ("mstore_tools.timestamp_generator", "Generate or convert timestamps"),
+    "validate": ("mstore_tools.schema_validator", "Validate localstore collections against source/schemas"),
+    "watch": ("mstore_tools.watcher", "Rebuild changelog/validation (and optionally the zip) when inputs change"),
+    "startup": ("mstore_tools.startup", "Measure import time of every command against the startup budget"),
+}
+
+PROG = "python -m mstore_tools"
+
+
+def print_usage(stream=sys.stdout):
+    width = max(len(name) for name in COMMANDS)
+    lines = [f"usage: {PROG} [--profile] [--profile-out FILE] [--cprofile FILE] <command> [options]", "", "commands:"]
+    for name, (_, help_text) in COMMANDS.items():
+        lines.append(f"  {name.ljust(width)}  {help_text}")
+    lines.append("")
+    lines.append("profiling:")
+    lines.append("  --profile           record per-phase wall/CPU time, bytes and file counts; JSON goes to stderr")
+    lines.append("  --profile-out FILE  write the profile JSON to FILE instead (implies --profile)")
+    lines.append("  --cprofile FILE     also dump cProfile stats to FILE (implies --profile)")
+    lines.append("")
+    lines.append(f"Run `{PROG} <command> --help` for command options.")
+    print("\n".join(lines), file=stream)
+
+
+def load_command(name):
+    """Imports the module behind `name` and returns its `main(argv)`."""
+    module_name, _ = COMMANDS[name]
+    return importlib.import_module(module_name).main
+
+
+def parse_global_options(argv):
+    """Splits leading profiling options off `argv`; returns (options, remaining argv)."""
+    options = {"profile": False, "profile_out": None, "cprofile": None}
+    while argv and argv[0].startswith("--"):
+        flag = argv[0]
+        if flag == "--profile":
+            options["profile"] = True
+            argv = argv[1:]
+        elif flag in ("--profile-out", "--cprofile"):
+            if len(argv) < 2:
+                raise ValueError(f"{flag} needs a file path")
+            options["profile"] = True
+            options[flag.lstrip("-").replace("-", "_")] = argv[1]
+            argv = argv[2:]
+        else:
+            break
+    return options, argv
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    try:
+        options, argv = parse_global_options(argv)
+    except ValueError as e:
+        print(f"❌ {e}\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        return 2
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage()
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"❌ Unknown command: {name}\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        return 2
+
+    if not options["profile"]:
+        try:
+            return load_command(name)(rest) or 0
+        except KeyboardInterrupt:
+            print("\n⚠️ Interrupted.")
+            return 130
+
+    from mstore_tools.profiling import PROFILER
+
+    PROFILER.start(" ".join([name] + rest), cprofile=bool(options["cprofile"]))
+    try:
+        with PROFILER.phase("import"):
+            command = load_command(name)
+        return command(rest) or 0
+    except KeyboardInterrupt:
+        print("\n⚠️ Interrupted.")
+        return 130
+    finally:
+        PROFILER.stop()
+        PROFILER.write_report(options["profile_out"])
+        if options["cprofile"]:
+            PROFILER.dump_cprofile(options["cprofile"])
@@ -1,14 +1,11 @@
 #!/usr/bin/env python3
 import json, os, datetime
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from InquirerPy.utils import color_print
 
-CONFIG_PATH = os.path.join("..", "source", "config.json")
+from mstore_tools.profiling import phase
 
-# Load JSON
-with open(CONFIG_PATH, "r") as f:
-    data = json.load(f)
+CONFIG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "source", "settings", "config.json"))
+
+data = None  # loaded by main()
 
 # Editable fields
 FIELDS = [
@@ -41,24 +38,25 @@ def deep_set(d, path, value):
         d = d[p]
     d[parts[-1]] = value
 
-# Display top arrow guide
-color_print([
-    ("yellow", "Use ↑/↓ arrows to navigate, press Enter to edit a field.\n")
-])
-
-# Modifier input once
-last_modifier = deep_get(data, "audit.modifyBy")
-modifier = inquirer.text(message="Modifier Name:", default=last_modifier).execute()
-deep_set(data, "audit.modifyBy", modifier)
-deep_set(data, "audit.modifyAt", datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat() + "Z")
+def load_json():
+    global data
+    with phase("config-load") as p:
+        with open(CONFIG_PATH, "rb") as f:
+            raw = f.read()
+        p.add(bytes_read=len(raw), files=1)
+        data = json.loads(raw)
 
 def save_json():
+    from InquirerPy.utils import color_print
     deep_set(data, "audit.modifyAt", datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat() + "Z")
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    with phase("config-save") as p:
+        with open(CONFIG_PATH, "w") as f:
+            json.dump(data, f, indent=2)
+        p.add(bytes_written=os.path.getsize(CONFIG_PATH), files=1)
     color_print([("green", "\n✅ Config successfully saved!\n")])
 
 def edit_field(field):
+    from InquirerPy import inquirer
     path = field["path"]
     label = field["label"]
     current_val = deep_get(data, path)
@@ -96,6 +94,8 @@ def edit_field(field):
     deep_set(data, path, answer)
 
 def main_menu():
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
     global last_selected_path
     while True:
         choices = []
@@ -130,8 +130,28 @@ def main_menu():
             last_selected_path = selection["path"]
             edit_field(selection)
 
-if __name__ == "__main__":
+def main(argv=None):
+    from InquirerPy import inquirer
+    from InquirerPy.utils import color_print
+
+    load_json()
+
+    # Display top arrow guide
+    color_print([
+        ("yellow", "Use ↑/↓ arrows to navigate, press Enter to edit a field.\n")
+    ])
+
     try:
+        # Modifier input once
+        last_modifier = deep_get(data, "audit.modifyBy")
+        modifier = inquirer.text(message="Modifier Name:", default=last_modifier).execute()
+        deep_set(data, "audit.modifyBy", modifier)
+        deep_set(data, "audit.modifyAt", datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat() + "Z")
+
         main_menu()
     except KeyboardInterrupt:
-        print("\n⚠️ Exited without saving.\n")
\ No newline at end of file
+        print("\n⚠️ Exited without saving.\n")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
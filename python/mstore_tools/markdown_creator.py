@@ -0,0 +1,115 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from mstore_tools.profiling import phase
+
+INPUT_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "localstore", "jsons", "versions.json")
+OUTPUT_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "..", "Versions", "CHANGELOG", "FULL_CHANGELOG.md")
+
+def iso_to_ist(iso_str):
+    """Convert ISO UTC datetime to IST readable format."""
+    if not iso_str:
+        return "N/A"
+    try:
+        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        # ✅ IST offset fix (no dependency on system timezone)
+        ist = timezone(timedelta(hours=5, minutes=30))
+        dt_ist = dt.astimezone(ist)
+        return dt_ist.strftime("%d %B %Y, %I:%M %p IST")
+    except Exception:
+        return "N/A"
+
+def render_entry(entry):
+    """Renders one versions.json entry as a markdown section."""
+    md = []
+    # Short commit
+    commit = entry.get("commitHash") or ""
+    commit_short = commit[:7] if commit else "N/A"
+
+    # ✅ Date conversion using helper
+    created_at = entry.get("audit", {}).get("createdAt")
+    date_str = iso_to_ist(created_at)
+
+    # Header
+    md.append(f"## Version {entry['version']} | {entry['environment'].capitalize()}\n\n")
+    md.append(f"**Title:** `{entry['title']}`\n")
+    md.append(f"**Date:** {date_str}\n")
+    md.append(f"**VersionId:** `{entry['versionId']}`\n")
+    md.append(f"**Commit:** `{commit_short}`\n\n")
+
+    # Sections
+    if entry.get("added"):
+        md.append("### ADDED\n")
+        for item in entry["added"]:
+            md.append(f"- {item}\n")
+        md.append("\n")
+
+    if entry.get("fixed"):
+        md.append("### FIXED\n")
+        for item in entry["fixed"]:
+            md.append(f"- {item}\n")
+        md.append("\n")
+
+    if entry.get("improved"):
+        md.append("### IMPROVED\n")
+        for item in entry["improved"]:
+            md.append(f"- {item}\n")
+        md.append("\n")
+
+    if entry.get("notes"):
+        md.append("### NOTES\n")
+        for item in entry["notes"]:
+            md.append(f"- {item}\n")
+        md.append("\n")
+
+    md.append("---\n\n")
+    return "".join(md)
+
+
+def json_to_md(data, output_file, render=render_entry):
+    """Writes the full changelog; pass a caching `render` to skip unchanged entries."""
+    with open(output_file, "w", encoding="utf-8") as md:
+        for entry in sorted(data, key=lambda x: x["version"], reverse=True):
+            md.write(render(entry))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m mstore_tools changelog", description="Render versions.json into markdown.")
+    parser.add_argument("--input", default=INPUT_FILE, help="versions.json to read")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="markdown file to write")
+    args = parser.parse_args(argv)
+
+    print("Starting markdown_creator.py script...")
+    input_file = args.input
+    output_file = args.output
+
+    try:
+        with phase("json-parse") as p:
+            with open(input_file, "rb") as f:
+                raw = f.read()
+            p.add(bytes_read=len(raw), files=1)
+            data = json.loads(raw)
+        print(f"Successfully read data from {os.path.normpath(input_file).replace(os.sep, '/')}")
+
+        with phase("markdown-render") as p:
+            json_to_md(data, output_file)
+            p.add(bytes_written=os.path.getsize(output_file), files=1)
+        print(f"Successfully wrote Markdown to {os.path.normpath(output_file).replace(os.sep, '/')}")
+        print("Script finished.")
+    except FileNotFoundError:
+        print(f"Error: Input file not found at {os.path.normpath(input_file).replace(os.sep, '/')}")
+        return 1
+    except json.JSONDecodeError:
+        print(f"Error: Could not decode JSON from {os.path.normpath(input_file).replace(os.sep, '/')}. Check file format.")
+        return 1
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
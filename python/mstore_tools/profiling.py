@@ -0,0 +1,143 @@
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+
+# Per-phase wall/CPU time and I/O counters for the tools. Disabled by default:
+# `phase()` then yields a shared no-op phase, so instrumented code costs nothing
+# unless the CLI was started with --profile.
+
+
+class Phase:
+    """Counters for one named phase. Repeated phases with the same name accumulate."""
+
+    __slots__ = ("name", "lock", "calls", "wall_ms", "cpu_ms", "bytes_read", "bytes_written", "files")
+
+    def __init__(self, name, lock):
+        self.name = name
+        self.lock = lock
+        self.calls = 0
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files = 0
+
+    def add(self, bytes_read=0, bytes_written=0, files=0, cpu_ms=0.0):
+        """Adds I/O counters; `cpu_ms` covers work done outside this process (pool workers)."""
+        with self.lock:
+            self.cpu_ms += cpu_ms
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+            self.files += files
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wallMs": round(self.wall_ms, 3),
+            "cpuMs": round(self.cpu_ms, 3),
+            "bytesRead": self.bytes_read,
+            "bytesWritten": self.bytes_written,
+            "files": self.files,
+        }
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def add(self, bytes_read=0, bytes_written=0, files=0, cpu_ms=0.0):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.command = None
+        self.phases = {}
+        # `watch` runs instrumented steps on worker threads.
+        self.lock = threading.Lock()
+        self._wall_start = None
+        self._cpu_start = None
+        self._wall_total = 0.0
+        self._cpu_total = 0.0
+        self._cprofile = None
+
+    def start(self, command, cprofile=False):
+        self.enabled = True
+        self.command = command
+        self.phases = {}
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def stop(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._wall_total = (time.perf_counter() - self._wall_start) * 1000
+        self._cpu_total = (time.process_time() - self._cpu_start) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield _NULL_PHASE
+            return
+        with self.lock:
+            record = self.phases.get(name)
+            if record is None:
+                record = self.phases[name] = Phase(name, self.lock)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            cpu_ms = (time.process_time() - cpu_start) * 1000
+            with self.lock:
+                record.wall_ms += wall_ms
+                record.cpu_ms += cpu_ms
+                record.calls += 1
+
+    def report(self):
+        return {
+            "command": self.command,
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "recordedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "totalWallMs": round(self._wall_total, 3),
+            "totalCpuMs": round(self._cpu_total, 3),
+            "phases": [record.to_dict() for record in list(self.phases.values())],
+        }
+
+    def write_report(self, output=None):
+        """Writes the JSON report to `output` (a path) or stderr."""
+        import json
+
+        text = json.dumps(self.report(), indent=2)
+        if output:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+            print(f"📊 Profile written to {os.path.abspath(output)}", file=sys.stderr)
+        else:
+            print(text, file=sys.stderr)
+
+    def dump_cprofile(self, output):
+        if self._cprofile is None:
+            return
+        self._cprofile.dump_stats(output)
+        print(f"📊 cProfile stats written to {os.path.abspath(output)} (view with: python -m pstats {output})", file=sys.stderr)
+
+
+PROFILER = Profiler()
+
+
+def phase(name):
+    """`with phase("walk") as p: ... p.add(files=1)` - a no-op unless profiling is on."""
+    return PROFILER.phase(name)
@@ -0,0 +1,671 @@
+import os
+import re
+import sys
+import json
+import time
+import itertools
+
+from mstore_tools.profiling import phase
+
+# --- Configuration ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DATA_DIR = os.path.join(PROJECT_ROOT, 'localstore', 'jsons')
+SCHEMA_DIR = os.path.join(PROJECT_ROOT, 'source', 'schemas')
+
+# Collections smaller than this are validated in-process; spawning workers costs more than it saves.
+PARALLEL_THRESHOLD = 5000
+CHUNK_SIZE = 2000
+
+# Inference recognises ID-shaped values loosely (some mock data has a 5-character
+# suffix) but always emits the documented PFX-YYYYMMDD-HHMMSS-SSS-RRRR pattern.
+ID_RE = re.compile(r'^([A-Z]{2,4})-[0-9]{8}-[0-9]{6}-[0-9]{3}-[A-Z0-9]{4,5}$')
+ID_PATTERN = '^{prefix}-[0-9]{{8}}-[0-9]{{6}}-[0-9]{{3}}-[A-Z0-9]{{4}}$'
+DATE_TIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$', re.IGNORECASE)
+URI_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:[^\s]*$')
+
+FORMATS = {
+    'date-time': DATE_TIME_RE.match,
+    'uri': URI_RE.match,
+}
+
+
+# --- Schema compiler ---
+# A schema is compiled once into nested closures: check(value, path, errors).
+# Only the JSON Schema keywords in KEYWORDS are supported. Any other keyword or
+# format raises ValueError at compile time rather than silently passing data.
+# Paths are linked tuples (parent, key) and only turned into "$.meta.links[0]"
+# when reported.
+
+KEYWORDS = frozenset((
+    'type', 'const', 'enum', 'pattern', 'minLength', 'maxLength', 'format',
+    'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+    'properties', 'required', 'additionalProperties', 'items', 'minItems', 'maxItems',
+    'allOf', 'anyOf', 'oneOf',
+))
+IGNORED_KEYWORDS = frozenset(('$schema', '$id', '$comment', 'title', 'description', 'default', 'examples', 'readOnly', 'writeOnly', 'deprecated'))
+
+ROOT = ('$',)
+
+
+def format_path(path):
+    parts = []
+    while len(path) == 2:
+        path, key = path
+        parts.append(f'[{key}]' if isinstance(key, int) else f'.{key}')
+    parts.append(path[0])
+    return ''.join(reversed(parts))
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+TYPE_CHECKS = {
+    'string': lambda v: isinstance(v, str),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'integer': _is_integer,
+    'boolean': lambda v: isinstance(v, bool),
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'null': lambda v: v is None,
+}
+
+# Types that a plain isinstance() settles (bool is an int, so numbers are not here).
+PY_TYPES = {'string': str, 'boolean': bool, 'object': dict, 'array': list, 'null': type(None)}
+
+
+def is_json_schema(schema):
+    """True if `schema` declares a structure; example-data files like stories-schema.json do not."""
+    return isinstance(schema, dict) and any(key in schema for key in ('type', 'properties', 'items', 'anyOf', 'oneOf', 'allOf'))
+
+
+def compile_schema(schema):
+    """Compiles a JSON Schema (dict or bool) into a `check(value, path, errors)` function."""
+    if schema is True:
+        return lambda value, path, errors: None
+    if schema is False:
+        return lambda value, path, errors: errors.append((path, 'is not allowed'))
+    if not isinstance(schema, dict):
+        raise ValueError(f'schema must be an object or boolean, got {_json_type(schema)}')
+
+    unsupported = set(schema) - KEYWORDS - IGNORED_KEYWORDS
+    if unsupported:
+        raise ValueError(f'unsupported schema keyword(s): {", ".join(sorted(unsupported))}')
+    if 'format' in schema and schema['format'] not in FORMATS:
+        raise ValueError(f'unsupported format "{schema["format"]}"')
+    if not schema.keys() & KEYWORDS:
+        return lambda value, path, errors: None
+
+    checks = []
+
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        for t in types:
+            if t not in TYPE_CHECKS:
+                raise ValueError(f'unsupported type "{t}"')
+        type_fns = tuple(TYPE_CHECKS[t] for t in types)
+        expected = ' or '.join(types)
+        # Nested keywords only make sense once the type matched, so a type
+        # mismatch short-circuits the rest of this schema.
+        if all(t in PY_TYPES for t in types):
+            py_types = tuple(PY_TYPES[t] for t in types)
+            def check_type(value, path, errors):
+                if isinstance(value, py_types):
+                    return True
+                errors.append((path, f'expected {expected}, got {_json_type(value)}'))
+                return False
+        else:
+            def check_type(value, path, errors):
+                for fn in type_fns:
+                    if fn(value):
+                        return True
+                errors.append((path, f'expected {expected}, got {_json_type(value)}'))
+                return False
+    else:
+        check_type = None
+
+    if 'const' in schema:
+        const = schema['const']
+        const_key = _json_key(const)
+        def check_const(value, path, errors):
+            if _json_key(value) != const_key:
+                errors.append((path, f'must be {json.dumps(const)}'))
+        checks.append(check_const)
+
+    if 'enum' in schema:
+        allowed = schema['enum']
+        allowed_set = frozenset(_json_key(v) for v in allowed)
+        def check_enum(value, path, errors):
+            if _json_key(value) not in allowed_set:
+                errors.append((path, f'must be one of {json.dumps(allowed)}'))
+        checks.append(check_enum)
+
+    if any(key in schema for key in ('pattern', 'minLength', 'maxLength', 'format')):
+        pattern = re.compile(schema['pattern']).search if 'pattern' in schema else None
+        pattern_text = schema.get('pattern')
+        min_length = schema.get('minLength')
+        max_length = schema.get('maxLength')
+        format_name = schema.get('format')
+        format_fn = FORMATS.get(format_name)
+        def check_string(value, path, errors):
+            if not isinstance(value, str):
+                return
+            if pattern is not None and not pattern(value):
+                errors.append((path, f'does not match {pattern_text}'))
+            if min_length is not None and len(value) < min_length:
+                errors.append((path, f'shorter than {min_length} characters'))
+            if max_length is not None and len(value) > max_length:
+                errors.append((path, f'longer than {max_length} characters'))
+            if format_fn is not None and not format_fn(value):
+                errors.append((path, f'is not a valid {format_name}'))
+        checks.append(check_string)
+
+    if any(key in schema for key in ('minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum')):
+        minimum = schema.get('minimum')
+        maximum = schema.get('maximum')
+        exclusive_minimum = schema.get('exclusiveMinimum')
+        exclusive_maximum = schema.get('exclusiveMaximum')
+        def check_number(value, path, errors):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return
+            if minimum is not None and value < minimum:
+                errors.append((path, f'less than {minimum}'))
+            if maximum is not None and value > maximum:
+                errors.append((path, f'greater than {maximum}'))
+            if exclusive_minimum is not None and value <= exclusive_minimum:
+                errors.append((path, f'must be greater than {exclusive_minimum}'))
+            if exclusive_maximum is not None and value >= exclusive_maximum:
+                errors.append((path, f'must be less than {exclusive_maximum}'))
+        checks.append(check_number)
+
+    if any(key in schema for key in ('properties', 'required', 'additionalProperties')):
+        properties = tuple(_compile_property(name, sub) for name, sub in schema.get('properties', {}).items())
+        known = frozenset(schema.get('properties', {}))
+        required = tuple(schema.get('required', ()))
+        additional = schema.get('additionalProperties', True)
+        additional_fn = compile_schema(additional) if isinstance(additional, dict) else None
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append((path, f'missing required property "{name}"'))
+            for name, fn, py_types, expected in properties:
+                item = value.get(name, _MISSING)
+                if item is _MISSING:
+                    continue
+                if fn is None:
+                    if not isinstance(item, py_types):
+                        errors.append(((path, name), f'expected {expected}, got {_json_type(item)}'))
+                else:
+                    fn(item, (path, name), errors)
+            if additional is True:
+                return
+            for name in value:
+                if name in known:
+                    continue
+                if additional is False:
+                    errors.append((path, f'unexpected property "{name}"'))
+                elif additional_fn is not None:
+                    additional_fn(value[name], (path, name), errors)
+        checks.append(check_object)
+
+    if any(key in schema for key in ('items', 'minItems', 'maxItems')):
+        items_fn = compile_schema(schema['items']) if 'items' in schema else None
+        min_items = schema.get('minItems')
+        max_items = schema.get('maxItems')
+        def check_array(value, path, errors):
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                errors.append((path, f'needs at least {min_items} items'))
+            if max_items is not None and len(value) > max_items:
+                errors.append((path, f'allows at most {max_items} items'))
+            if items_fn is not None:
+                for index, item in enumerate(value):
+                    items_fn(item, (path, index), errors)
+        checks.append(check_array)
+
+    for keyword in ('allOf', 'anyOf', 'oneOf'):
+        if keyword in schema:
+            checks.append(_compile_combinator(keyword, [compile_schema(sub) for sub in schema[keyword]]))
+
+    checks = tuple(checks)
+
+    if check_type is not None and len(checks) == 1:
+        only = checks[0]
+        def check(value, path, errors):
+            if check_type(value, path, errors):
+                only(value, path, errors)
+        return check
+    if check_type is None:
+        def check(value, path, errors):
+            for fn in checks:
+                fn(value, path, errors)
+    else:
+        def check(value, path, errors):
+            if check_type(value, path, errors):
+                for fn in checks:
+                    fn(value, path, errors)
+    return check
+
+
+_MISSING = object()
+
+# Keywords that don't constrain a value; a property using only these plus a
+# plain type is checked inline by its parent object instead of via a closure.
+ANNOTATIONS = frozenset(('type', 'description', 'default', 'title', '$comment', 'examples'))
+
+
+def _compile_property(name, schema):
+    """Returns (name, check or None, isinstance types, expected-type text) for one property."""
+    if isinstance(schema, dict) and 'type' in schema and ANNOTATIONS.issuperset(schema):
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        if all(t in PY_TYPES for t in types):
+            return name, None, tuple(PY_TYPES[t] for t in types), ' or '.join(types)
+    return name, compile_schema(schema), None, None
+
+
+def _compile_combinator(keyword, fns):
+    def matches(fn, value, path):
+        branch_errors = []
+        fn(value, path, branch_errors)
+        return not branch_errors
+
+    if keyword == 'allOf':
+        def check(value, path, errors):
+            for fn in fns:
+                fn(value, path, errors)
+    elif keyword == 'anyOf':
+        def check(value, path, errors):
+            if not any(matches(fn, value, path) for fn in fns):
+                errors.append((path, 'does not match any allowed schema (anyOf)'))
+    else:
+        def check(value, path, errors):
+            if sum(1 for fn in fns if matches(fn, value, path)) != 1:
+                errors.append((path, 'must match exactly one schema (oneOf)'))
+    return check
+
+
+def _json_key(value):
+    """Hashable key for JSON equality: true != 1 (Python says otherwise), 1 == 1.0."""
+    if isinstance(value, bool):
+        return ('boolean', value)
+    if isinstance(value, (int, float)):
+        return ('number', value)
+    if isinstance(value, (dict, list)):
+        return ('json', json.dumps(value, sort_keys=True))
+    return (_json_type(value), value)
+
+
+def _json_type(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, (int, float)):
+        return 'number'
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, list):
+        return 'array'
+    return 'object'
+
+
+# --- Schema inference ---
+
+def infer_schema(documents, required_depth=2):
+    """Infers a JSON Schema from sample documents.
+
+    Keys present in every document are required at the top level and inside
+    `meta` (see docs/schema-guide.md); deeper objects only get typed properties,
+    since a handful of mock documents can't tell optional from required fields.
+    """
+    return _infer(list(documents), depth=0, required_depth=required_depth, key=None)
+
+
+def _infer(values, depth, required_depth, key):
+    # Numbers stay "number" (a price of 12 today may be 12.5 tomorrow) and a
+    # field only ever seen as null is left untyped.
+    types = []
+    for value in values:
+        t = _json_type(value)
+        if t not in types:
+            types.append(t)
+    if types == ['null']:
+        return {}
+
+    schema = {'type': types[0] if len(types) == 1 else types}
+
+    objects = [v for v in values if isinstance(v, dict)]
+    keys = [name for obj in objects for name in obj]
+    if keys and all(ID_RE.match(name) for name in keys):
+        # A map keyed by document ID (e.g. orders.orderItems): the sample IDs
+        # say nothing about other documents, so only the values are described.
+        schema['additionalProperties'] = _infer([obj[name] for obj in objects for name in obj], depth + 1, required_depth, None)
+    elif objects:
+        names = []
+        for obj in objects:
+            for name in obj:
+                if name not in names:
+                    names.append(name)
+        schema['properties'] = {
+            name: _infer([obj[name] for obj in objects if name in obj], depth + 1, required_depth, name)
+            for name in names
+        }
+        if depth < required_depth and (depth == 0 or key == 'meta'):
+            required = [name for name in names if all(name in obj for obj in objects)]
+            if required:
+                schema['required'] = required
+
+    arrays = [v for v in values if isinstance(v, list)]
+    items = [item for array in arrays for item in array]
+    if items:
+        schema['items'] = _infer(items, depth + 1, required_depth, None)
+
+    strings = [v for v in values if isinstance(v, str)]
+    if strings and len(strings) == len([v for v in values if v is not None]):
+        if key and key.endswith('Id'):
+            prefixes = {m.group(1) if m else None for m in map(ID_RE.match, strings)}
+            if len(prefixes) == 1 and None not in prefixes:
+                schema['pattern'] = ID_PATTERN.format(prefix=prefixes.pop())
+        elif all(DATE_TIME_RE.match(s) for s in strings):
+            schema['format'] = 'date-time'
+
+    return schema
+
+
+# --- Collections ---
+
+def singular(name):
+    if name.endswith('ies'):
+        return name[:-3] + 'y'
+    if name.endswith('s'):
+        return name[:-1]
+    return name
+
+
+def find_schema(collection, schema_dir=SCHEMA_DIR):
+    """Returns (path, schema) for the first real JSON Schema of `collection`, or (None, None)."""
+    for name in (singular(collection), collection):
+        path = os.path.join(schema_dir, f'{name}-schema.json')
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        if is_json_schema(schema):
+            return path, schema
+    return None, None
+
+
+def extract_documents(collection, data):
+    """Collections are stored as a list, or as a wrapper object holding the list (stories.json)."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get(collection), list):
+        return data[collection]
+    raise ValueError(f'{collection}: expected a list of documents')
+
+
+def load_documents(collection, path, profile_phase):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    profile_phase.add(bytes_read=len(raw), files=1)
+    return extract_documents(collection, json.loads(raw))
+
+
+def iter_jsonl_chunks(path, chunk_size):
+    """Yields (start index, raw byte lines) without loading the whole file; workers do the parsing."""
+    chunk, start, index = [], 0, 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if not chunk:
+                start = index
+            chunk.append(line)
+            index += 1
+            if len(chunk) >= chunk_size:
+                yield start, chunk
+                chunk = []
+    if chunk:
+        yield start, chunk
+
+
+# --- Workers ---
+# Each worker compiles every schema once in its initializer; chunks then only
+# carry (collection, start index, documents).
+
+_VALIDATORS = {}
+
+
+def _init_worker(schemas):
+    _VALIDATORS.clear()
+    for collection, schema in schemas.items():
+        _VALIDATORS[collection] = compile_schema(schema)
+
+
+def validate_chunk(collection, start, documents, raw=False, max_errors=None):
+    """Validates one chunk; returns (collection, documents checked, [(index, path, message), ...])."""
+    check = _VALIDATORS[collection]
+    found = []
+    for offset, document in enumerate(documents):
+        index = start + offset
+        if raw:
+            try:
+                document = json.loads(document)
+            except ValueError as e:  # JSONDecodeError, or bytes that aren't UTF-8
+                found.append((index, '$', f'invalid JSON: {e}'))
+                continue
+        errors = []
+        check(document, ROOT, errors)
+        for path, message in errors:
+            found.append((index, format_path(path), message))
+        if max_errors is not None and len(found) >= max_errors:
+            return collection, offset + 1, found[:max_errors]
+    return collection, len(documents), found
+
+
+def _validate_chunk_timed(*args):
+    """validate_chunk for pool workers; also returns the CPU ms it took, which the parent can't measure."""
+    cpu_start = time.process_time()
+    result = validate_chunk(*args)
+    return result, (time.process_time() - cpu_start) * 1000
+
+
+# --- Runner ---
+
+def resolve_targets(names, data_dir, collection_override=None):
+    """Maps CLI arguments (collection names or .json/.jsonl paths) to (collection, path)."""
+    if not names:
+        names = sorted(os.path.splitext(f)[0] for f in os.listdir(data_dir) if f.endswith('.json'))
+    targets = []
+    for name in names:
+        if name.endswith(('.json', '.jsonl')):
+            collection = collection_override or os.path.splitext(os.path.basename(name))[0]
+            targets.append((collection, os.path.abspath(name)))
+        else:
+            targets.append((name, os.path.join(data_dir, f'{name}.json')))
+    return targets
+
+
+def iter_chunks(targets, chunk_size):
+    """Yields (collection, start, documents, raw) for every target, reading files lazily."""
+    for collection, path in targets:
+        if path.endswith('.jsonl'):
+            # Time each read separately; a phase held open across `yield` would
+            # also count the validation done by the consumer.
+            reader = iter_jsonl_chunks(path, chunk_size)
+            while True:
+                with phase('read') as p:
+                    chunk = next(reader, None)
+                    if chunk is not None:
+                        p.add(bytes_read=sum(len(line) for line in chunk[1]))
+                if chunk is None:
+                    break
+                yield collection, chunk[0], chunk[1], True
+            continue
+        with phase('json-parse') as p:
+            documents = load_documents(collection, path, p)
+        for start in range(0, len(documents), chunk_size):
+            yield collection, start, documents[start:start + chunk_size], False
+
+
+def run_validation(targets, schemas, emit, jobs=None, chunk_size=CHUNK_SIZE, max_errors=None):
+    """Validates `targets` and calls emit(collection, index, path, message) as errors are found.
+
+    Returns {collection: {"documents": n, "errors": n}}. Small inputs are checked
+    in-process; anything over PARALLEL_THRESHOLD documents is fanned out to a
+    process pool, keeping at most two chunks per worker in flight.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    stats = {collection: {'documents': 0, 'errors': 0} for collection, _ in targets}
+    chunks = iter_chunks(targets, chunk_size)
+    remaining = [max_errors]
+
+    def record(result):
+        collection, checked, found = result
+        stats[collection]['documents'] += checked
+        for index, path, message in found:
+            if remaining[0] is not None:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+            stats[collection]['errors'] += 1
+            emit(collection, index, path, message)
+        return remaining[0] is None or remaining[0] > 0
+
+    # Buffer chunks until we know whether a pool is worth starting. Without
+    # spare CPUs there is nothing to decide, so chunks stream straight through.
+    buffered = []
+    if jobs > 1:
+        buffered_docs = 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            buffered_docs += len(chunk[2])
+            if buffered_docs >= PARALLEL_THRESHOLD:
+                break
+        else:
+            jobs = 1
+
+    # Worker CPU time is invisible to the parent's process_time(), so pool
+    # results carry their own and are added to the phase.
+    with phase('validate') as p:
+        if jobs == 1:
+            with phase('schema-compile'):
+                _init_worker(schemas)
+            for collection, start, documents, raw in itertools.chain(buffered, chunks):
+                if not record(validate_chunk(collection, start, documents, raw, remaining[0])):
+                    break
+            return stats
+
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+        def submit(chunk):
+            collection, start, documents, raw = chunk
+            return pool.submit(_validate_chunk_timed, collection, start, documents, raw, max_errors)
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schemas,)) as pool:
+            pending = set()
+            source = iter(buffered)
+            stopped = False
+            while not stopped:
+                for chunk in source:
+                    pending.add(submit(chunk))
+                    if len(pending) >= jobs * 2:
+                        break
+                else:
+                    if source is not chunks:
+                        source = chunks
+                        continue
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, cpu_ms = future.result()
+                    p.add(cpu_ms=cpu_ms)
+                    if not record(result):
+                        stopped = True
+            for future in pending:
+                future.cancel()
+    return stats
+
+
+def write_inferred_schema(collection, documents, schema_dir=SCHEMA_DIR):
+    """Infers a schema for `collection` and writes it as <singular>-schema.json; returns (path, schema)."""
+    name = singular(collection)
+    inferred = infer_schema(documents)
+    schema = {
+        '$schema': 'https://json-schema.org/draft/2020-12/schema',
+        'title': f'mStore {name.replace("-", " ").title()} Schema',
+        'description': f"Defines the structure for a single {name.replace('-', ' ')} document in the '{collection}' collection.",
+        '$comment': f'Inferred from localstore/jsons/{collection}.json by `python -m mstore_tools validate --write-schemas`. Refine by hand.',
+    }
+    schema.update(inferred)
+    path = os.path.join(schema_dir, f'{name}-schema.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(schema, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return path, schema
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m mstore_tools validate", description="Validate localstore collections against source/schemas.")
+    parser.add_argument("targets", nargs="*", help="collection names (e.g. items orders) or .json/.jsonl files; default: every collection in localstore/jsons")
+    parser.add_argument("--collection", help="collection whose schema applies to the given files (default: file name)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes for large inputs (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"documents per worker task (default: {CHUNK_SIZE})")
+    parser.add_argument("--max-errors", type=int, default=None, help="stop after this many errors")
+    parser.add_argument("--json", action="store_true", help="stream errors as JSON lines")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="folder holding <collection>.json files")
+    parser.add_argument("--schema-dir", default=SCHEMA_DIR, help="folder holding <collection>-schema.json files")
+    parser.add_argument("--write-schemas", action="store_true", help="infer and write a schema for every collection that has none")
+    args = parser.parse_args(argv)
+
+    targets = resolve_targets(args.targets, args.data_dir, args.collection)
+    schemas, skipped = {}, []
+    for collection, path in targets:
+        if not os.path.exists(path):
+            print(f"❌ {collection}: {path} not found", file=sys.stderr)
+            return 2
+        schema_path, schema = find_schema(collection, args.schema_dir)
+        if schema is None and args.write_schemas:
+            with phase('schema-infer') as p:
+                if path.endswith('.jsonl'):
+                    documents = [json.loads(line) for _, lines in iter_jsonl_chunks(path, CHUNK_SIZE) for line in lines]
+                else:
+                    documents = load_documents(collection, path, p)
+                schema_path, schema = write_inferred_schema(collection, documents, args.schema_dir)
+                p.add(files=1, bytes_written=os.path.getsize(schema_path))
+            print(f"📝 {collection}: wrote {os.path.relpath(schema_path, PROJECT_ROOT)}", file=sys.stderr)
+        if schema is None:
+            skipped.append(collection)
+            continue
+        try:
+            compile_schema(schema)  # fail here, not inside every worker
+        except ValueError as e:
+            print(f"❌ {collection}: {os.path.relpath(schema_path, PROJECT_ROOT)}: {e}", file=sys.stderr)
+            return 2
+        schemas[collection] = schema
+    targets = [(collection, path) for collection, path in targets if collection in schemas]
+
+    if args.json:
+        def emit(collection, index, path, message):
+            print(json.dumps({"collection": collection, "index": index, "path": path, "message": message}), flush=True)
+    else:
+        def emit(collection, index, path, message):
+            print(f"❌ {collection}[{index}] {path}: {message}", flush=True)
+
+    stats = run_validation(targets, schemas, emit, args.jobs, args.chunk_size, args.max_errors)
+
+    summary = sys.stderr if args.json else sys.stdout
+    print("", file=summary)
+    for collection, counts in stats.items():
+        mark = "❌" if counts['errors'] else "✅"
+        print(f"{mark} {collection}: {counts['documents']} documents, {counts['errors']} errors", file=summary)
+    for collection in skipped:
+        print(f"⚠️ {collection}: no schema in {os.path.relpath(args.schema_dir, PROJECT_ROOT)} (use --write-schemas)", file=summary)
+
+    return 1 if any(counts['errors'] for counts in stats.values()) else 0
@@ -0,0 +1,68 @@
+import os
+import sys
+import json
+import subprocess
+
+# Import time of any single command module, measured in a fresh interpreter.
+# Heavy or platform-only dependencies (zipfile, InquirerPy, prompt_toolkit,
+# pytz, msvcrt) must stay inside the functions that use them.
+STARTUP_BUDGET_MS = 50
+
+PACKAGE_PARENT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Prints the import time in ms of the module passed as argv[1].
+_MEASURE_SNIPPET = (
+    "import sys, time, importlib\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+)
+
+
+def measure_import_ms(module_name, runs=5):
+    """Returns the best-of-`runs` import time of `module_name` in milliseconds."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SNIPPET, module_name],
+            cwd=PACKAGE_PARENT, capture_output=True, text=True, check=True,
+        )
+        elapsed = float(result.stdout.strip())
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_all(runs=5):
+    from mstore_tools.cli import COMMANDS
+
+    modules = ["mstore_tools.cli"] + [module for module, _ in COMMANDS.values()]
+    return {module: measure_import_ms(module, runs) for module in modules}
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m mstore_tools startup", description="Measure import time of every command module.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module, best time is kept (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help=f"per-module budget (default: {STARTUP_BUDGET_MS})")
+    parser.add_argument("--json", action="store_true", help="print results as JSON for tracking across releases")
+    args = parser.parse_args(argv)
+
+    timings = measure_all(args.runs)
+    over_budget = [module for module, ms in timings.items() if ms > args.budget_ms]
+
+    if args.json:
+        print(json.dumps({
+            "budgetMs": args.budget_ms,
+            "python": sys.version.split()[0],
+            "importMs": {module: round(ms, 3) for module, ms in timings.items()},
+            "overBudget": over_budget,
+        }, indent=2))
+    else:
+        width = max(len(module) for module in timings)
+        for module, ms in timings.items():
+            mark = "❌" if module in over_budget else "✅"
+            print(f"{mark} {module.ljust(width)}  {ms:7.2f} ms")
+        print(f"\nBudget: {args.budget_ms:g} ms per module")
+
+    return 1 if over_budget else 0
@@ -1,6 +1,6 @@
 import datetime
 import os
-import msvcrt
+import sys
 import json
 
 # --- Configuration ---
@@ -25,6 +25,27 @@ def print_header(text):
     clear_screen()
     print(f"{Colors.BOLD}{Colors.HEADER}--- {text} ---{Colors.ENDC}\n")
 
+def read_key():
+    """Blocks for one key press and returns 'up', 'down', 'enter', 'esc' or the typed character."""
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getch()
+        if key == b'\xe0':  # Arrow key
+            return {b'H': 'up', b'P': 'down'}.get(msvcrt.getch(), '')
+        return {b'\r': 'enter', b'\x1b': 'esc'}.get(key, key.decode(errors='ignore'))
+
+    import select, termios, tty
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        key = os.read(fd, 1)
+        if key == b'\x1b' and select.select([fd], [], [], 0.05)[0]:  # Arrow keys arrive as ESC [ A/B
+            return {b'[A': 'up', b'[B': 'down'}.get(os.read(fd, 2), '')
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return {b'\r': 'enter', b'\n': 'enter', b'\x1b': 'esc'}.get(key, key.decode(errors='ignore'))
+
 # --- Usage Tracking ---
 def load_usage_counts():
     if not os.path.exists(USAGE_FILE):
@@ -101,15 +122,13 @@ def display_menu(options, title, styles_with_examples=None):
             else:
                 print(f"  {line}")
         
-        key = msvcrt.getch()
+        key = read_key()
 
-        if key == b'\xe0':  # Arrow key
-            key = msvcrt.getch()
-            if key == b'H':  # Up
-                current_option = (current_option - 1) % len(options)
-            elif key == b'P':  # Down
-                current_option = (current_option + 1) % len(options)
-        elif key == b'\r':  # Enter
+        if key == 'up':
+            current_option = (current_option - 1) % len(options)
+        elif key == 'down':
+            current_option = (current_option + 1) % len(options)
+        elif key == 'enter':
             clear_screen()
             return options[current_option]
 
@@ -164,7 +183,7 @@ def run_generator():
             print(f"  {Colors.BOLD}Value:{Colors.ENDC} {Colors.CYAN}{timestamp}{Colors.ENDC}\n")
             print(f"{message}\n")
             print("Press any key to return to the generator menu...")
-            msvcrt.getch()
+            read_key()
 
 def run_converter():
     while True:
@@ -199,11 +218,10 @@ def run_converter():
             print("Please use the ISO 8601 format with a timezone (e.g., 'Z' or '+00:00').")
         
         print("\nPress any key to convert another, or Esc to return to the main menu...")
-        key = msvcrt.getch()
-        if key == b'\x1b': # Escape key
+        if read_key() == 'esc':
             return
 
-def main():
+def main(argv=None):
     # On Windows, this enables ANSI escape sequences
     if os.name == 'nt':
         os.system('')
@@ -220,6 +238,7 @@ def main():
             clear_screen()
             print(f"{Colors.GREEN}Done. Goodbye!{Colors.ENDC}")
             break
+    return 0
 
 
 if __name__ == "__main__":
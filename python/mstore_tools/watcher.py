@@ -0,0 +1,425 @@
+import os
+import sys
+import time
+import fnmatch
+import threading
+
+from mstore_tools.profiling import phase
+
+# --- Configuration ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+IGNORE_DIRS = {'node_modules', '.git', '__pycache__', '.husky', '.vscode'}
+DEBOUNCE_SECONDS = 0.15
+MAX_DELAY_SECONDS = 0.5  # upper bound on debouncing while writes keep arriving
+POLL_INTERVAL = 0.5
+WORKERS = 4
+
+# Marks "something changed but we don't know what" (inotify queue overflow);
+# every step treats it as a full rebuild.
+EVERYTHING = '*'
+
+
+# --- Build steps ---
+# Each step declares its inputs (glob patterns relative to PROJECT_ROOT) and
+# receives only the changed paths that matched them.
+
+_RENDERED = {}  # versions.json entry (serialized) -> rendered markdown
+
+
+def build_changelog(changed):
+    """Re-renders the changelog, reusing the markdown of entries that did not change."""
+    import json
+    from mstore_tools import markdown_creator
+
+    with open(markdown_creator.INPUT_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    seen = set()
+    rendered = [0]
+
+    def render(entry):
+        key = json.dumps(entry, sort_keys=True)
+        seen.add(key)
+        if key not in _RENDERED:
+            _RENDERED[key] = markdown_creator.render_entry(entry)
+            rendered[0] += 1
+        return _RENDERED[key]
+
+    os.makedirs(os.path.dirname(markdown_creator.OUTPUT_FILE), exist_ok=True)
+    markdown_creator.json_to_md(data, markdown_creator.OUTPUT_FILE, render)
+    for key in set(_RENDERED) - seen:
+        del _RENDERED[key]
+    return f"{rendered[0]} of {len(data)} entries re-rendered"
+
+
+def validate_collections(changed):
+    """Validates only the collections whose data or schema changed."""
+    from mstore_tools import schema_validator
+
+    data_dir = schema_validator.DATA_DIR
+    all_collections = sorted(os.path.splitext(f)[0] for f in os.listdir(data_dir) if f.endswith('.json'))
+    collections = set()
+    for path in changed:
+        if path == EVERYTHING:
+            collections.update(all_collections)
+            continue
+        name = os.path.basename(path)
+        if os.path.dirname(path) == data_dir:
+            collections.add(os.path.splitext(name)[0])
+        elif name.endswith('-schema.json'):
+            schema_name = name[:-len('-schema.json')]
+            collections.update(c for c in all_collections if schema_name in (c, schema_validator.singular(c)))
+
+    targets, schemas = [], {}
+    for collection in sorted(collections):
+        path = os.path.join(data_dir, f'{collection}.json')
+        _, schema = schema_validator.find_schema(collection)
+        if schema is None or not os.path.exists(path):
+            continue
+        targets.append((collection, path))
+        schemas[collection] = schema
+
+    def emit(collection, index, path, message):
+        print(f"   ❌ {collection}[{index}] {path}: {message}", flush=True)
+
+    stats = schema_validator.run_validation(targets, schemas, emit, jobs=1)
+    errors = sum(counts['errors'] for counts in stats.values())
+    return f"{', '.join(stats) or 'nothing to check'}: {errors} errors"
+
+
+def build_zip(changed):
+    import logging
+    from mstore_tools import zip_creator
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    zip_path = zip_creator.create_project_zip()
+    if zip_path is None:
+        raise RuntimeError("zip creation failed (see log above)")
+    return os.path.basename(zip_path)
+
+
+STEPS = [
+    {
+        "name": "changelog",
+        "inputs": ["localstore/jsons/versions.json"],
+        "outputs": ["../Versions/CHANGELOG/FULL_CHANGELOG.md"],
+        "run": build_changelog,
+    },
+    {
+        "name": "validate",
+        "inputs": ["localstore/jsons/*.json", "source/schemas/*-schema.json"],
+        "outputs": [],
+        "run": validate_collections,
+    },
+    {
+        # A full archive of the tree; opt-in with --zip since any edit triggers it.
+        "name": "zip",
+        "inputs": ["*"],
+        "outputs": ["../Versions/*.zip"],
+        "run": build_zip,
+        "optional": True,
+    },
+]
+
+
+# --- Dependency graph ---
+
+class BuildGraph:
+    """Maps changed input paths to the steps that consume them."""
+
+    def __init__(self, steps, root=PROJECT_ROOT):
+        self.steps = steps
+        self.root = root
+        self._cache = {}
+        self.outputs = [os.path.normpath(os.path.join(root, pattern)) for step in steps for pattern in step["outputs"]]
+
+    def is_output(self, path):
+        return any(fnmatch.fnmatch(path, pattern) for pattern in self.outputs)
+
+    def steps_for(self, path):
+        if path == EVERYTHING:
+            return tuple(self.steps)
+        steps = self._cache.get(path)
+        if steps is None:
+            rel = os.path.relpath(path, self.root).replace(os.sep, '/')
+            steps = self._cache[path] = tuple(
+                step for step in self.steps if any(fnmatch.fnmatch(rel, pattern) for pattern in step["inputs"])
+            )
+        return steps
+
+    def affected(self, paths):
+        """Returns [(step, changed paths)] in STEPS order."""
+        by_step = {}
+        for path in paths:
+            if path != EVERYTHING and self.is_output(path):
+                continue
+            for step in self.steps_for(path):
+                by_step.setdefault(step["name"], set()).add(path)
+        return [(step, by_step[step["name"]]) for step in self.steps if step["name"] in by_step]
+
+
+# --- Scheduler ---
+
+class Scheduler:
+    """Runs steps on a thread pool. A step never runs twice at once: changes
+    that arrive while it runs are merged into a single follow-up run."""
+
+    def __init__(self, graph, workers=WORKERS):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.graph = graph
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.lock = threading.Lock()
+        self.running = set()
+        self.pending = {}
+
+    def dispatch(self, paths):
+        for step, changed in self.graph.affected(paths):
+            self.submit(step, changed)
+
+    def submit(self, step, changed):
+        name = step["name"]
+        with self.lock:
+            if name in self.running:
+                self.pending.setdefault(name, set()).update(changed)
+                return
+            self.running.add(name)
+        self.pool.submit(self._run, step, changed)
+
+    def _run(self, step, changed):
+        name = step["name"]
+        while changed:
+            start = time.perf_counter()
+            try:
+                with phase(name) as p:
+                    result = step["run"](changed)
+                    p.add(files=len(changed))
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"✅ {name} ({len(changed)} changed) in {elapsed:.0f} ms" + (f" - {result}" if result else ""), flush=True)
+            except Exception as e:
+                print(f"❌ {name} failed: {e}", flush=True)
+            with self.lock:
+                changed = self.pending.pop(name, None)
+                if not changed:
+                    self.running.discard(name)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+
+# --- File watchers ---
+
+class PollingWatcher:
+    """Portable fallback: diffs (mtime, size) snapshots of the tree."""
+
+    name = "polling"
+
+    def __init__(self, root):
+        self.root = root
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        stack = [self.root]
+        while stack:
+            folder = stack.pop()
+            try:
+                entries = os.scandir(folder)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            stack.append(entry.path)
+                    else:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def read(self, timeout):
+        time.sleep(timeout)
+        current = self.scan()
+        previous, self.snapshot = self.snapshot, current
+        changed = {path for path, stamp in current.items() if previous.get(path) != stamp}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify through ctypes; one watch per directory."""
+
+    name = "inotify"
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.ctypes = ctypes
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.folders = {}
+        self.root = root
+        self.add_tree(root)
+
+    def add_tree(self, root):
+        """Watches `root` and its subfolders; returns the files found (new folders may hold files already)."""
+        files = []
+        for folder, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(folder), self.MASK)
+            if wd < 0:
+                errno = self.ctypes.get_errno()
+                raise OSError(errno, f"inotify_add_watch failed for {folder}: {os.strerror(errno)}")
+            self.folders[wd] = folder
+            files.extend(os.path.join(folder, name) for name in names)
+        return files
+
+    def remove_tree(self, root):
+        """Drops the watches on `root` and its subfolders (the folder was moved away or deleted)."""
+        prefix = os.path.join(root, '')
+        for wd, folder in list(self.folders.items()):
+            if folder == root or folder.startswith(prefix):
+                del self.folders[wd]
+                self.libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout):
+        import select
+        import struct
+
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = struct.unpack_from('iIII', data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b'\0')
+            offset += 16 + length
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add(EVERYTHING)
+                continue
+            if mask & self.IN_IGNORED:
+                # The kernel dropped this watch (folder deleted, unmounted or rm_watch).
+                self.folders.pop(wd, None)
+                continue
+            folder = self.folders.get(wd)
+            if folder is None:
+                continue
+            if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                # A moved folder keeps its watch but `folder` is now stale; the
+                # parent's IN_MOVED_TO re-adds it under its new path.
+                self.remove_tree(folder)
+                continue
+            if not name:
+                continue
+            path = os.path.join(folder, os.fsdecode(name))
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_MOVED_FROM | self.IN_DELETE):
+                    self.remove_tree(path)
+                elif mask & (self.IN_CREATE | self.IN_MOVED_TO) and os.path.basename(path) not in IGNORE_DIRS:
+                    changed.update(self.add_tree(path))
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(root, force_poll=False):
+    if not force_poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️ inotify unavailable ({e}), falling back to polling.", file=sys.stderr)
+    return PollingWatcher(root)
+
+
+# --- Main loop ---
+
+def watch(watcher, scheduler, debounce=DEBOUNCE_SECONDS, idle_timeout=POLL_INTERVAL, max_delay=MAX_DELAY_SECONDS):
+    """Collects changes until the tree has been quiet for `debounce` seconds, then dispatches them.
+
+    A steady stream of writes never stays quiet, so pending changes are also
+    dispatched once the oldest of them has waited `max_delay` seconds.
+    """
+    changed = set()
+    first_change = last_change = 0.0
+    while True:
+        if changed:
+            now = time.monotonic()
+            timeout = max(0.0, min(last_change + debounce, first_change + max_delay) - now)
+        else:
+            timeout = idle_timeout
+        events = watcher.read(timeout)
+        now = time.monotonic()
+        if events:
+            if not changed:
+                first_change = now
+            changed |= events
+            last_change = now
+        if changed and (now - last_change >= debounce or now - first_change >= max_delay):
+            scheduler.dispatch(changed)
+            changed = set()
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m mstore_tools watch", description="Rebuild derived artifacts when their inputs change.")
+    parser.add_argument("--zip", action="store_true", help="also rebuild the release zip on every change")
+    parser.add_argument("--poll", action="store_true", help="use mtime polling even when inotify is available")
+    parser.add_argument("--workers", type=int, default=WORKERS, help=f"build steps that may run at once (default: {WORKERS})")
+    parser.add_argument("--debounce-ms", type=int, default=int(DEBOUNCE_SECONDS * 1000), help="quiet period before rebuilding (default: %(default)s)")
+    parser.add_argument("--max-delay-ms", type=int, default=int(MAX_DELAY_SECONDS * 1000), help="rebuild at the latest this long after the first pending change, even if writes continue (default: %(default)s)")
+    parser.add_argument("--initial", action="store_true", help="run every step once before watching")
+    args = parser.parse_args(argv)
+
+    steps = [step for step in STEPS if args.zip or not step.get("optional")]
+    graph = BuildGraph(steps)
+    scheduler = Scheduler(graph, args.workers)
+    watcher = create_watcher(PROJECT_ROOT, args.poll)
+
+    print(f"👀 Watching {PROJECT_ROOT} ({watcher.name}); steps: {', '.join(step['name'] for step in steps)}")
+    for step in steps:
+        print(f"   {step['name']}: {', '.join(step['inputs'])}")
+    print("Press Ctrl+C to stop.\n", flush=True)
+
+    if args.initial:
+        scheduler.dispatch({EVERYTHING})
+
+    try:
+        watch(watcher, scheduler, args.debounce_ms / 1000, POLL_INTERVAL, args.max_delay_ms / 1000)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching.")
+    finally:
+        watcher.close()
+        scheduler.shutdown()
+    return 0
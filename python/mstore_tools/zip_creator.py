@@ -1,26 +1,13 @@
 import os
-import zipfile
 import json
 import logging
 from datetime import datetime
 import sys # Added
 
-# --- Configure Logging ---
-# --- Configure Logging ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s: %(message)s'
-)
-
-# --- Attempt to import pytz ---
-try:
-    import pytz
-    PYTZ_AVAILABLE = True
-except ImportError:
-    PYTZ_AVAILABLE = False
+from mstore_tools.profiling import phase
 
 # --- Configuration ---
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 ZIP_EXPORT_DIR = os.path.abspath(os.path.join(PROJECT_ROOT, '../Versions'))
 
 EXCLUDE_DIRS = ['node_modules', '.git', '__pycache__',]
@@ -32,14 +19,19 @@ def get_latest_version():
     logging.info("Trying to determine the latest version...")
     try:
         versioner_config_path = os.path.join(PROJECT_ROOT, 'versioner', 'versioner.json')
-        with open(versioner_config_path, 'r', encoding='utf-8') as f:
-            versioner_config = json.load(f)
-        
-        versions_file_rel_path = versioner_config['updateIn']['jsonFile']
-        versions_file_abs_path = os.path.join(PROJECT_ROOT, versions_file_rel_path)
-        
-        with open(versions_file_abs_path, 'r', encoding='utf-8') as f:
-            versions_data = json.load(f)
+        with phase("json-parse") as p:
+            with open(versioner_config_path, "rb") as f:
+                raw = f.read()
+            p.add(bytes_read=len(raw), files=1)
+            versioner_config = json.loads(raw)
+
+            versions_file_rel_path = versioner_config['updateIn']['jsonFile']
+            versions_file_abs_path = os.path.join(PROJECT_ROOT, versions_file_rel_path)
+
+            with open(versions_file_abs_path, "rb") as f:
+                raw = f.read()
+            p.add(bytes_read=len(raw), files=1)
+            versions_data = json.loads(raw)
         
         if versions_data and len(versions_data) > 0:
             latest_version = versions_data[0].get('version', '0.0.0')
@@ -54,21 +46,23 @@ def get_latest_version():
 
 def get_ist_timestamp():
     """Generates a formatted timestamp, preferring IST if pytz is available."""
-    if PYTZ_AVAILABLE:
-        ist = pytz.timezone('Asia/Kolkata')
-        return datetime.now(ist).strftime('%d%m%Y_%H%M%S')
-    else:
+    try:
+        import pytz
+    except ImportError:
         return datetime.now().strftime('%d%m%Y_%H%M%S')
+    ist = pytz.timezone('Asia/Kolkata')
+    return datetime.now(ist).strftime('%d%m%Y_%H%M%S')
 
 def create_project_zip():
-    """Creates a zip archive with professional logging."""
+    """Creates a zip archive with professional logging; returns its path, or None if it failed."""
+    import zipfile
 
     version = get_latest_version()
     timestamp = get_ist_timestamp()
 
     if version == '0.0.0':
         logging.error("Could not determine project version. Aborting zip creation.")
-        return
+        return None
 
     if not os.path.exists(ZIP_EXPORT_DIR):
         os.makedirs(ZIP_EXPORT_DIR)
@@ -84,7 +78,8 @@ def create_project_zip():
     skipped_items = []
 
     try:
-        with zipfile.ZipFile(zip_filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        entries = []
+        with phase("walk") as p:
             for root, dirs, files in os.walk(PROJECT_ROOT):
                 original_dirs = list(dirs)
                 dirs[:] = [d for d in original_dirs if d not in EXCLUDE_DIRS]
@@ -103,7 +98,15 @@ def create_project_zip():
                     if os.path.abspath(os.path.join(root, file)) == os.path.abspath(zip_filepath):
                         continue
                         
-                    zipf.write(os.path.join(root, file), file_rel_path)
+                    entries.append((os.path.join(root, file), file_rel_path))
+            p.add(files=len(entries))
+
+        with phase("compress") as p:
+            with zipfile.ZipFile(zip_filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for file_path, file_rel_path in entries:
+                    zipf.write(file_path, file_rel_path)
+                    p.add(bytes_read=zipf.filelist[-1].file_size, files=1)
+            p.add(bytes_written=os.path.getsize(zip_filepath))
         
         if skipped_items:
             # logging.info("Skipped the following items:")
@@ -115,11 +118,30 @@ def create_project_zip():
         sys.stdout.flush() # Added
         logging.info(f"Output file: {zip_filepath}")
         sys.stderr.flush() # Added
+        return zip_filepath
 
     except Exception as e:
         logging.error(f"An error occurred during zip creation: {e}", exc_info=True)
+        return None
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m mstore_tools zip", description="Create a zip archive of the project.")
+    parser.add_argument("--manual", action="store_true", help="prompt for version and note, and append to the local version log")
+    args = parser.parse_args(argv)
+
+    if args.manual:
+        from mstore_tools import zip_creator_manual
+        return zip_creator_manual.main()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(levelname)s: %(message)s'
+    )
+    return 0 if create_project_zip() else 1
+    return 0
 
 # --- Run the script ---
 if __name__ == "__main__":
-    create_project_zip()
-    sys.exit(0) # Added
\ No newline at end of file
+    sys.exit(main()) # Added
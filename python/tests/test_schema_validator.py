@@ -0,0 +1,262 @@
+import json
+
+import pytest
+
+from mstore_tools import schema_validator
+from mstore_tools.schema_validator import ROOT, compile_schema, format_path, infer_schema, resolve_targets, run_validation, validate_chunk, _init_worker
+
+
+def errors_for(schema, value):
+    errors = []
+    compile_schema(schema)(value, ROOT, errors)
+    return [(format_path(path), message) for path, message in errors]
+
+
+# --- Boolean and empty schemas ---
+
+def test_true_and_empty_schema_accept_everything():
+    for value in (1, "x", None, [1], {"a": 1}):
+        assert errors_for(True, value) == []
+        assert errors_for({}, value) == []
+        assert errors_for({"description": "annotations only"}, value) == []
+
+
+def test_false_schema_rejects_everything():
+    assert errors_for(False, 1) == [("$", "is not allowed")]
+    assert errors_for(False, None) == [("$", "is not allowed")]
+
+
+def test_false_subschemas_reject():
+    assert errors_for({"type": "array", "items": False}, [1]) == [("$[0]", "is not allowed")]
+    assert errors_for({"type": "array", "items": False}, []) == []
+    assert errors_for({"properties": {"a": False}}, {"a": 1}) == [("$.a", "is not allowed")]
+    assert errors_for({"properties": {"a": False}}, {"b": 1}) == []
+
+
+# --- type ---
+
+@pytest.mark.parametrize("schema_type, good, bad", [
+    ("string", "x", 1),
+    ("boolean", True, 1),
+    ("integer", 3, True),
+    ("integer", 3.0, 3.5),
+    ("number", 3.5, False),
+    ("null", None, 0),
+    ("array", [], {}),
+    ("object", {}, []),
+])
+def test_type(schema_type, good, bad):
+    assert errors_for({"type": schema_type}, good) == []
+    assert len(errors_for({"type": schema_type}, bad)) == 1
+
+
+def test_type_mismatch_skips_nested_keywords():
+    assert errors_for({"type": "object", "required": ["a"]}, "x") == [("$", "expected object, got string")]
+
+
+# --- const / enum ---
+
+def test_enum_does_not_confuse_booleans_and_numbers():
+    assert errors_for({"enum": [True]}, True) == []
+    assert len(errors_for({"enum": [True]}, 1)) == 1
+    assert len(errors_for({"enum": [1]}, True)) == 1
+    assert len(errors_for({"enum": [0]}, False)) == 1
+
+
+def test_enum_numbers_compare_by_value():
+    assert errors_for({"enum": [1]}, 1.0) == []
+
+
+def test_enum_with_objects_and_arrays():
+    schema = {"enum": [{"a": 1}, [1, 2], None]}
+    assert errors_for(schema, {"a": 1}) == []
+    assert errors_for(schema, [1, 2]) == []
+    assert errors_for(schema, None) == []
+    assert len(errors_for(schema, [True, 2])) == 1
+
+
+def test_const():
+    assert errors_for({"const": "rating"}, "rating") == []
+    assert errors_for({"const": "rating"}, "feedback") == [("$", 'must be "rating"')]
+    assert len(errors_for({"const": 1}, True)) == 1
+    assert len(errors_for({"const": False}, 0)) == 1
+
+
+# --- strings and numbers ---
+
+def test_pattern_and_lengths():
+    schema = {"type": "string", "pattern": "^RTG-", "minLength": 5, "maxLength": 6}
+    assert errors_for(schema, "RTG-12") == []
+    assert len(errors_for(schema, "XX-123")) == 1
+    assert len(errors_for(schema, "RTG-")) == 1
+    assert len(errors_for(schema, "RTG-123")) == 1
+
+
+def test_formats():
+    assert errors_for({"format": "date-time"}, "2025-10-03T10:30:00Z") == []
+    assert len(errors_for({"format": "date-time"}, "2025-10-03")) == 1
+    assert errors_for({"format": "uri"}, "https://example.com/a.jpg") == []
+    assert len(errors_for({"format": "uri"}, "not a uri")) == 1
+
+
+def test_minimum_maximum():
+    schema = {"type": "integer", "minimum": 1, "maximum": 5}
+    assert errors_for(schema, 1) == []
+    assert errors_for(schema, 5) == []
+    assert len(errors_for(schema, 0)) == 1
+    assert len(errors_for(schema, 6)) == 1
+    assert len(errors_for({"exclusiveMinimum": 0}, 0)) == 1
+
+
+# --- objects and arrays ---
+
+def test_required_and_nested_paths():
+    schema = {"type": "object", "required": ["meta"], "properties": {
+        "meta": {"type": "object", "properties": {"links": {"type": "array", "items": {"type": "string"}}}},
+    }}
+    assert errors_for(schema, {}) == [("$", 'missing required property "meta"')]
+    assert errors_for(schema, {"meta": {"links": ["a", 2]}}) == [("$.meta.links[1]", "expected string, got number")]
+
+
+def test_additional_properties():
+    closed = {"properties": {"a": {"type": "string"}}, "additionalProperties": False}
+    assert errors_for(closed, {"a": "x"}) == []
+    assert errors_for(closed, {"a": "x", "b": 1}) == [("$", 'unexpected property "b"')]
+
+    typed = {"properties": {"a": {}}, "additionalProperties": {"type": "number"}}
+    assert errors_for(typed, {"a": "x", "b": 1}) == []
+    assert errors_for(typed, {"b": "x"}) == [("$.b", "expected number, got string")]
+
+
+def test_array_length():
+    schema = {"type": "array", "minItems": 1, "maxItems": 2}
+    assert errors_for(schema, [1]) == []
+    assert len(errors_for(schema, [])) == 1
+    assert len(errors_for(schema, [1, 2, 3])) == 1
+
+
+# --- combinators ---
+
+def test_all_of():
+    schema = {"allOf": [{"type": "string"}, {"minLength": 2}]}
+    assert errors_for(schema, "ab") == []
+    assert len(errors_for(schema, "a")) == 1
+
+
+def test_any_of():
+    schema = {"anyOf": [{"type": "string"}, {"type": "null"}]}
+    assert errors_for(schema, "a") == []
+    assert errors_for(schema, None) == []
+    assert len(errors_for(schema, 1)) == 1
+
+
+def test_one_of():
+    schema = {"oneOf": [{"type": "number"}, {"type": "integer"}]}
+    assert errors_for(schema, 1.5) == []
+    assert len(errors_for(schema, 1)) == 1  # matches both
+
+
+# --- unsupported input fails loudly ---
+
+def test_unsupported_keyword_and_format_raise():
+    with pytest.raises(ValueError, match=r"\$ref"):
+        compile_schema({"$ref": "#/definitions/x"})
+    with pytest.raises(ValueError, match="email"):
+        compile_schema({"type": "string", "format": "email"})
+    with pytest.raises(ValueError):
+        compile_schema({"properties": {"a": {"patternProperties": {}}}})
+    with pytest.raises(ValueError, match="datetime"):
+        compile_schema({"type": "datetime"})
+    with pytest.raises(ValueError, match="datetime"):
+        compile_schema({"type": ["string", "datetime"]})
+
+
+# --- inference ---
+
+def test_infer_types_and_required():
+    documents = [
+        {"meta": {"itemId": "ITM-20251002-172501-801-QWRS", "note": None}, "price": 12, "tags": []},
+        {"meta": {"itemId": "ITM-20251002-172501-802-ABCD", "note": None}, "price": 12.5},
+    ]
+    schema = infer_schema(documents)
+    assert schema["type"] == "object"
+    assert schema["required"] == ["meta", "price"]
+    assert schema["properties"]["price"] == {"type": "number"}
+    assert schema["properties"]["tags"] == {"type": "array"}
+    meta = schema["properties"]["meta"]
+    assert meta["required"] == ["itemId", "note"]
+    assert meta["properties"]["note"] == {}
+    for document in documents:
+        assert errors_for(schema, document) == []
+
+
+def test_infer_id_pattern_uses_documented_four_character_suffix():
+    schema = infer_schema([{"meta": {"ratingId": "RTG-20251003-103008-001-QWERT"}}])
+    pattern = schema["properties"]["meta"]["properties"]["ratingId"]["pattern"]
+    assert pattern == "^RTG-[0-9]{8}-[0-9]{6}-[0-9]{3}-[A-Z0-9]{4}$"
+    assert len(errors_for(schema, {"meta": {"ratingId": "RTG-20251003-103008-001-QWERT"}})) == 1
+    assert errors_for(schema, {"meta": {"ratingId": "RTG-20251003-103008-001-QWER"}}) == []
+
+
+def test_infer_date_time_format():
+    schema = infer_schema([{"at": "2025-10-03T10:30:00Z"}, {"at": "2025-10-04T10:30:00+05:30"}])
+    assert schema["properties"]["at"] == {"type": "string", "format": "date-time"}
+
+
+def test_infer_id_keyed_map_uses_additional_properties():
+    documents = [
+        {"orderItems": {"ITM-20251002-172501-801-QWRS": {"quantity": 1}, "ITM-20251002-172502-802-ASDF": {"quantity": 2.5}}},
+        {"orderItems": {}},
+    ]
+    order_items = infer_schema(documents)["properties"]["orderItems"]
+    assert order_items == {"type": "object", "additionalProperties": {"type": "object", "properties": {"quantity": {"type": "number"}}}}
+    schema = infer_schema(documents)
+    assert errors_for(schema, {"orderItems": {"ITM-20251101-090000-001-ABCD": {"quantity": 3}}}) == []
+    assert errors_for(schema, {"orderItems": {"ITM-20251101-090000-001-ABCD": {"quantity": "3"}}}) == [
+        ("$.orderItems.ITM-20251101-090000-001-ABCD.quantity", "expected number, got string")]
+
+
+def test_infer_mixed_keys_stay_properties():
+    schema = infer_schema([{"links": {"ITM-20251002-172501-801-QWRS": 1, "total": 2}}])
+    assert set(schema["properties"]["links"]["properties"]) == {"ITM-20251002-172501-801-QWRS", "total"}
+
+
+def test_required_only_at_top_level_and_meta():
+    schema = infer_schema([{"info": {"name": "a"}}])
+    assert "required" not in schema["properties"]["info"]
+
+
+# --- runner helpers ---
+
+def test_validate_chunk_reports_invalid_json_lines():
+    _init_worker({"things": {"type": "object"}})
+    _, checked, found = validate_chunk("things", 10, [b'{}', b'{broken', json.dumps([1]).encode()], raw=True)
+    assert checked == 3
+    assert [(index, path) for index, path, _ in found] == [(11, "$"), (12, "$")]
+
+
+def test_resolve_targets_keeps_missing_file_paths(tmp_path):
+    missing = str(tmp_path / "nosuch.jsonl")
+    assert resolve_targets([missing], str(tmp_path)) == [("nosuch", missing)]
+    assert resolve_targets(["items"], str(tmp_path)) == [("items", str(tmp_path / "items.json"))]
+
+
+def test_single_job_streams_errors_before_input_is_read(monkeypatch):
+    yielded = []
+
+    def fake_chunks(targets, chunk_size):
+        for start in range(0, 100, 10):
+            yielded.append(start)
+            yield "things", start, [b'"bad"' if start == 0 else b'{}'] * 10, True
+
+    monkeypatch.setattr(schema_validator, "iter_chunks", fake_chunks)
+    seen_at_first_error = []
+
+    def emit(collection, index, path, message):
+        if not seen_at_first_error:
+            seen_at_first_error.append(len(yielded))
+
+    stats = run_validation([("things", "things.jsonl")], {"things": {"type": "object"}}, emit, jobs=1, max_errors=1)
+    assert seen_at_first_error == [1]
+    assert len(yielded) == 1
+    assert stats == {"things": {"documents": 1, "errors": 1}}
@@ -0,0 +1,197 @@
+import os
+import sys
+import threading
+import types
+
+import pytest
+
+from mstore_tools import watcher
+from mstore_tools.watcher import EVERYTHING, BuildGraph, Scheduler, watch
+
+
+def make_steps():
+    def run(changed):
+        return None
+
+    return [
+        {"name": "changelog", "inputs": ["localstore/jsons/versions.json"], "outputs": ["out/CHANGELOG.md"], "run": run},
+        {"name": "validate", "inputs": ["localstore/jsons/*.json", "source/schemas/*-schema.json"], "outputs": [], "run": run},
+        {"name": "zip", "inputs": ["*"], "outputs": ["out/*.zip"], "run": run, "optional": True},
+    ]
+
+
+def names(affected):
+    return [(step["name"], sorted(changed)) for step, changed in affected]
+
+
+# --- BuildGraph ---
+
+def test_affected_maps_paths_to_steps_in_order():
+    graph = BuildGraph(make_steps()[:2], root="/repo")
+    versions = "/repo/localstore/jsons/versions.json"
+    items = "/repo/localstore/jsons/items.json"
+    schema = "/repo/source/schemas/item-schema.json"
+    assert names(graph.affected({items, versions, schema, "/repo/README.md"})) == [
+        ("changelog", [versions]),
+        ("validate", sorted([items, versions, schema])),
+    ]
+
+
+def test_affected_skips_output_paths():
+    graph = BuildGraph(make_steps(), root="/repo")
+    assert graph.affected({"/repo/out/CHANGELOG.md", "/repo/out/MSTORE_v1.zip"}) == []
+    assert names(graph.affected({"/repo/index.html"})) == [("zip", ["/repo/index.html"])]
+
+
+def test_affected_everything_runs_every_step():
+    graph = BuildGraph(make_steps(), root="/repo")
+    assert [name for name, _ in names(graph.affected({EVERYTHING}))] == ["changelog", "validate", "zip"]
+
+
+# --- Scheduler ---
+
+def test_changes_during_a_run_merge_into_one_follow_up_run():
+    runs = []
+    started, release = threading.Event(), threading.Event()
+
+    def slow(changed):
+        runs.append(set(changed))
+        if len(runs) == 1:
+            started.set()
+            release.wait(5)
+
+    step = {"name": "validate", "inputs": ["*.json"], "outputs": [], "run": slow}
+    scheduler = Scheduler(BuildGraph([step], root="/repo"), workers=2)
+    try:
+        scheduler.dispatch({"/repo/a.json"})
+        assert started.wait(5)
+        scheduler.dispatch({"/repo/b.json"})
+        scheduler.dispatch({"/repo/c.json", "/repo/b.json"})
+        release.set()
+    finally:
+        scheduler.shutdown()
+    assert runs == [{"/repo/a.json"}, {"/repo/b.json", "/repo/c.json"}]
+    assert not scheduler.running and not scheduler.pending
+
+
+def test_failed_step_is_reported(capsys):
+    def broken(changed):
+        raise RuntimeError("zip creation failed")
+
+    step = {"name": "zip", "inputs": ["*"], "outputs": [], "run": broken}
+    scheduler = Scheduler(BuildGraph([step], root="/repo"), workers=1)
+    scheduler.dispatch({"/repo/a.txt"})
+    scheduler.shutdown()
+    assert "❌ zip failed: zip creation failed" in capsys.readouterr().out
+
+
+def test_build_zip_raises_when_archive_fails(monkeypatch):
+    from mstore_tools import zip_creator
+
+    monkeypatch.setattr(zip_creator, "create_project_zip", lambda: None)
+    with pytest.raises(RuntimeError):
+        watcher.build_zip({"/repo/a.txt"})
+    monkeypatch.setattr(zip_creator, "create_project_zip", lambda: "/out/MSTORE_v1.zip")
+    assert watcher.build_zip({"/repo/a.txt"}) == "MSTORE_v1.zip"
+
+
+# --- watch() debounce ---
+
+class Stop(Exception):
+    pass
+
+
+class ScriptedWatcher:
+    """Replays (delay, events) on a fake clock; raises Stop once the script is done and the loop idles."""
+
+    def __init__(self, script, clock):
+        self.script = list(script)
+        self.clock = clock
+
+    def read(self, timeout):
+        if not self.script:
+            if self.clock.idle_reads >= 3:
+                raise Stop
+            self.clock.idle_reads += 1
+            self.clock.now += timeout
+            return set()
+        delay, events = self.script[0]
+        if delay > timeout:
+            self.script[0] = (delay - timeout, events)
+            self.clock.now += timeout
+            return set()
+        self.script.pop(0)
+        self.clock.now += delay
+        return set(events)
+
+
+class RecordingScheduler:
+    def __init__(self, clock):
+        self.clock = clock
+        self.dispatched = []
+
+    def dispatch(self, paths):
+        self.dispatched.append((round(self.clock.now, 3), sorted(paths)))
+
+
+def run_watch(monkeypatch, script, **kwargs):
+    clock = types.SimpleNamespace(now=100.0, idle_reads=0)
+    monkeypatch.setattr(watcher, "time", types.SimpleNamespace(monotonic=lambda: clock.now, sleep=lambda s: None))
+    scheduler = RecordingScheduler(clock)
+    with pytest.raises(Stop):
+        watch(ScriptedWatcher(script, clock), scheduler, **kwargs)
+    return [(round(at - 100.0, 3), paths) for at, paths in scheduler.dispatched]
+
+
+def test_debounce_batches_a_burst_into_one_dispatch(monkeypatch):
+    script = [(0.01, {"a"}), (0.05, {"b"}), (0.05, {"a", "c"})]
+    assert run_watch(monkeypatch, script, debounce=0.15, max_delay=0.5) == [(0.26, ["a", "b", "c"])]
+
+
+def test_quiet_gap_splits_dispatches(monkeypatch):
+    script = [(0.01, {"a"}), (1.0, {"b"})]
+    assert run_watch(monkeypatch, script, debounce=0.15, max_delay=0.5) == [(0.16, ["a"]), (1.16, ["b"])]
+
+
+def test_max_delay_caps_continuous_writes(monkeypatch):
+    script = [(0.1, {f"f{i}"}) for i in range(15)]  # a write every 100 ms, never quiet for 150 ms
+    dispatched = run_watch(monkeypatch, script, debounce=0.15, max_delay=0.5)
+    assert [at for at, _ in dispatched] == [0.6, 1.2, 1.65]
+    assert sorted(path for _, paths in dispatched for path in paths) == sorted(f"f{i}" for i in range(15))
+    assert all(len(paths) <= 6 for _, paths in dispatched)
+
+
+# --- inotify ---
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_follows_renamed_and_deleted_folders(tmp_path):
+    os.makedirs(tmp_path / "a" / "sub")
+    inotify = watcher.InotifyWatcher(str(tmp_path))
+
+    def drain():
+        changed = set()
+        for _ in range(3):
+            changed |= inotify.read(0.05)
+        return {os.path.relpath(path, tmp_path) for path in changed}
+
+    def folders():
+        return sorted(os.path.relpath(folder, tmp_path) for folder in inotify.folders.values())
+
+    try:
+        os.rename(tmp_path / "a", tmp_path / "b")
+        drain()
+        assert folders() == [".", "b", os.path.join("b", "sub")]
+        (tmp_path / "b" / "sub" / "x.json").write_text("{}")
+        assert drain() == {os.path.join("b", "sub", "x.json")}
+
+        os.rename(tmp_path / "b" / "sub", tmp_path / "sub2")
+        drain()
+        assert folders() == [".", "b", "sub2"]
+
+        os.rmdir(tmp_path / "b")
+        drain()
+        assert folders() == [".", "sub2"]
+        (tmp_path / "sub2" / "y.json").write_text("{}")
+        assert drain() == {os.path.join("sub2", "y.json")}
+    finally:
+        inotify.close()